@@ -0,0 +1,43 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled Braille block packing for img2braille.py.
+
+Optional: img2braille.py falls back to its NumPy packer when this module
+is not built. Build it in place with:
+
+    cythonize -i scripts/_braille_pack.pyx
+
+which also leaves scripts/_braille_pack.c and scripts/build/ behind (both
+gitignored).
+"""
+
+import numpy as np
+
+
+def braille_pack(const unsigned char[:, ::1] bits):
+    """Pack a (height, width) 0/1 uint8 array into Braille codepoints.
+
+    height must be a multiple of 4 and width a multiple of 2. Returns a
+    (height // 4, width // 2) uint16 array of codepoints in the U+2800
+    block, using the same dot layout as BRAILLE_MAP.
+    """
+    cdef Py_ssize_t rows = bits.shape[0] // 4
+    cdef Py_ssize_t cols = bits.shape[1] // 2
+    out = np.empty((rows, cols), dtype=np.uint16)
+    cdef unsigned short[:, ::1] codes = out
+    cdef Py_ssize_t by, bx, y, x
+
+    for by in range(rows):
+        y = by * 4
+        for bx in range(cols):
+            x = bx * 2
+            codes[by, bx] = 0x2800 | (
+                bits[y, x]
+                | bits[y + 1, x] << 1
+                | bits[y + 2, x] << 2
+                | bits[y, x + 1] << 3
+                | bits[y + 1, x + 1] << 4
+                | bits[y + 2, x + 1] << 5
+                | bits[y + 3, x] << 6
+                | bits[y + 3, x + 1] << 7
+            )
+    return out
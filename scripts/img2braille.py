@@ -7,7 +7,8 @@ to binary, and maps each 2x4 block to the corresponding Braille codepoint.
 
 Preprocessing pipeline:
   1. Convert to grayscale
-  2. CLAHE (local contrast) to bring out facial features
+  2. CLAHE (local contrast) to bring out facial features (OpenCV if
+     installed, otherwise a NumPy fallback; the two differ, see clahe())
   3. Unsharp mask to sharpen edges
   4. Optional gamma correction
   5. Dithering (Atkinson or Floyd-Steinberg)
@@ -17,11 +18,30 @@ Usage:
 """
 
 import argparse
-import math
+import functools
+import os
 import sys
 
+import numpy as np
 from PIL import Image, ImageFilter, ImageOps
 
+# OpenCV is optional: when present, CLAHE runs in its native tiled
+# implementation instead of the NumPy fallback below. The two do not
+# produce the same output, so rendered art depends on whether it is
+# installed.
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# The compiled Braille packer is optional (see scripts/_braille_pack.pyx);
+# braille_pack() falls back to NumPy when it has not been built.
+try:
+    from _braille_pack import braille_pack as _braille_pack_ext
+except ImportError:
+    _braille_pack_ext = None
+
+
 # Braille dot positions: each dot in a 2x4 grid maps to a specific bit.
 # Column 0 (left):  rows 0-2 -> bits 0,1,2; row 3 -> bit 6
 # Column 1 (right): rows 0-2 -> bits 3,4,5; row 3 -> bit 7
@@ -32,23 +52,119 @@ BRAILLE_MAP = [
     [0x40, 0x80],  # row 3
 ]
 
+# Codepoint for each byte produced by np.packbits over a cell's 8 dots taken
+# in row-major order (MSB = top-left dot), remapped to the BRAILLE_MAP bits.
+_PACKED_DOTS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+BRAILLE_LUT = (
+    0x2800
+    + _PACKED_DOTS.astype(np.uint16)
+    @ np.array(BRAILLE_MAP, dtype=np.uint16).ravel()
+)
+
+# Tile LUTs that agree to within this many intensity levels are treated as
+# uniform by the NumPy CLAHE, skipping the bilinear blend (error <= eps - 1).
+CLAHE_UNIFORM_EPS = 2
+
+# Bounds for pixel values accumulated by the dither kernels when clamping.
+# A clamped pixel stays on the same side of the 128 threshold, so only the
+# error it passes on changes, not its own dot.
+ERROR_MIN = 0
+ERROR_MAX = 255
+
+# Dither buffers smaller than this many pixels run the kernels as plain
+# Python rather than paying for the Numba import (see _kernel).
+JIT_MIN_PIXELS = 200_000
+
+# OpenCV CLAHE objects keyed by (clip_limit, grid_size), reused across calls.
+_CLAHE = {}
+
+# Scratch arrays keyed by name, reused across calls while the shape and
+# dtype stay the same (see _get_scratch).
+_SCRATCH = {}
+
+# Numba-compiled dither kernels, keyed by the Python function.
+_JITTED = {}
+
 
 def clahe(img, clip_limit=2.0, grid_size=8):
-    """Contrast Limited Adaptive Histogram Equalization (pure Pillow).
+    """Contrast Limited Adaptive Histogram Equalization.
 
     Divides the image into grid_size x grid_size tiles, equalizes each
     tile's histogram with a clipped redistribution, then bilinearly
-    interpolates between tiles for smooth transitions.
+    interpolates between tiles for smooth transitions. Uses OpenCV when
+    available and falls back to a NumPy implementation otherwise.
+
+    The two paths are not interchangeable: OpenCV redistributes the
+    clipped excess and pads border tiles differently, so its result can
+    differ from the fallback by tens of intensity levels, and a flat image
+    gains dithered texture with OpenCV that the fallback leaves blank.
+    Render with the same path to reproduce existing art.
+
+    The grid is capped so tiles are at least 4 pixels on a side; images
+    too small to tile at all get plain global equalization.
     """
     width, height = img.size
-    pixels = list(img.getdata())
-    src = [pixels[y * width : (y + 1) * width] for y in range(height)]
+    if width * height < 64:
+        return ImageOps.equalize(img)
+    grid_size = max(1, min(grid_size, min(width, height) // 4))
+
+    if cv2 is not None:
+        arr = np.asarray(img, dtype=np.uint8)
+        return Image.fromarray(_cv2_clahe(clip_limit, grid_size).apply(arr))
+
+    src = np.asarray(img, dtype=np.uint8)
 
     tile_w = max(width // grid_size, 1)
     tile_h = max(height // grid_size, 1)
 
-    # Build per-tile LUTs.
-    luts = {}
+    luts = _get_scratch("luts", (grid_size, grid_size, 256), np.uint8)
+    _clahe_luts(src, float(clip_limit), grid_size, tile_w, tile_h, luts)
+
+    # Bilinear interpolation between tiles: each pixel blends the LUTs of
+    # its four surrounding tile centers. Rows that share the same pair of
+    # tile rows form a band and are blended together.
+    ty1, ty2, wy = _tile_weights(height, tile_h, grid_size)
+    tx1, tx2, wx = _tile_weights(width, tile_w, grid_size)
+
+    out = np.empty((height, width), dtype=np.uint8)
+    starts = np.flatnonzero(np.diff(ty1, prepend=-1)).tolist()
+    for y0, y1 in zip(starts, starts[1:] + [height]):
+        band = src[y0:y1]
+        a, b = ty1[y0], ty2[y0]
+
+        # Fast path: if every LUT touching this band agrees to within
+        # CLAHE_UNIFORM_EPS over the band's intensity range, the blend
+        # cannot move the result by more than that, so a single lookup
+        # suffices.
+        lo, hi = int(band.min()), int(band.max())
+        used = luts[[a, b], :, lo : hi + 1]
+        spread = used.max(axis=(0, 1)) - used.min(axis=(0, 1))
+        if spread.max() < CLAHE_UNIFORM_EPS:
+            out[y0:y1] = luts[a, tx1, band]
+            continue
+
+        v00 = luts[a, tx1, band]
+        v10 = luts[a, tx2, band]
+        v01 = luts[b, tx1, band]
+        v11 = luts[b, tx2, band]
+
+        wyb = wy[y0:y1, None]
+        top = v00 * (1 - wx) + v10 * wx
+        bot = v01 * (1 - wx) + v11 * wx
+        result = top * (1 - wyb) + bot * wyb
+        out[y0:y1] = np.clip(result, 0, 255)
+
+    return Image.fromarray(out)
+
+
+def _clahe_luts(src, clip_limit, grid_size, tile_w, tile_h, luts):
+    """Build the clipped-histogram LUT of every tile.
+
+    Fills luts, a (grid_size, grid_size, 256) uint8 array indexed as
+    luts[ty, tx, value]. A grid is at most 8x8 tiles, so this stays in
+    NumPy; compiling it costs far more than it saves.
+    """
+    height, width = src.shape
     for ty in range(grid_size):
         for tx in range(grid_size):
             x0 = tx * tile_w
@@ -56,66 +172,102 @@ def clahe(img, clip_limit=2.0, grid_size=8):
             x1 = min(x0 + tile_w, width)
             y1 = min(y0 + tile_h, height)
 
-            hist = [0] * 256
-            for y in range(y0, y1):
-                for x in range(x0, x1):
-                    hist[src[y][x]] += 1
+            tile = src[y0:y1, x0:x1]
+            hist = np.bincount(tile.ravel(), minlength=256)
 
-            n = (x1 - x0) * (y1 - y0)
-            limit = max(int(clip_limit * n / 256), 1)
+            limit = max(int(clip_limit * tile.size / 256), 1)
 
-            excess = 0
-            for i in range(256):
-                if hist[i] > limit:
-                    excess += hist[i] - limit
-                    hist[i] = limit
+            # Clip in place and redistribute the excess evenly across all
+            # bins. The histogram sums to the tile size, so the excess falls
+            # out of the clipped total without a separate pass.
+            np.minimum(hist, limit, out=hist)
+            excess = tile.size - int(hist.sum())
+            hist += excess // 256
+            hist[: excess % 256] += 1
 
-            bonus = excess // 256
-            remainder = excess % 256
-            for i in range(256):
-                hist[i] += bonus
-                if i < remainder:
-                    hist[i] += 1
+            cdf = np.cumsum(hist)
+            total = cdf[-1] if cdf[-1] > 0 else 1
+            lut = np.clip((255.0 * cdf / total).astype(np.int32), 0, 255)
+            luts[ty, tx] = lut
 
-            cdf = [0] * 256
-            cdf[0] = hist[0]
-            for i in range(1, 256):
-                cdf[i] = cdf[i - 1] + hist[i]
 
-            total = cdf[255] if cdf[255] > 0 else 1
-            lut = [min(255, int(255.0 * cdf[i] / total)) for i in range(256)]
-            luts[(tx, ty)] = lut
+def _kernel(fn, size):
+    """Return the dither kernel fn to run over a buffer of size pixels.
 
-    # Bilinear interpolation between tiles.
-    out = Image.new("L", (width, height))
-    out_pixels = out.load()
+    Numba is optional and imported lazily: importing it and loading a
+    cached compilation costs more than running the plain Python loop over
+    a default-width portrait, so fn is only compiled for buffers of at
+    least JIT_MIN_PIXELS. Falls back to fn when Numba is not installed.
+    """
+    if size < JIT_MIN_PIXELS:
+        return fn
+
+    jitted = _JITTED.get(fn)
+    if jitted is None:
+        try:
+            import numba
+        except ImportError:
+            jitted = fn
+        else:
+            jitted = numba.njit(cache=True, boundscheck=False)(fn)
+        _JITTED[fn] = jitted
+    return jitted
+
+
+def _get_scratch(name, shape, dtype):
+    """Return the cached scratch array for name, reallocating on mismatch.
+
+    Contents are whatever the previous caller left; callers must fully
+    overwrite the array before reading it.
+    """
+    buf = _SCRATCH.get(name)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = np.empty(shape, dtype=dtype)
+        _SCRATCH[name] = buf
+    return buf
 
-    for y in range(height):
-        fy = (y - tile_h / 2.0) / tile_h
-        ty1 = max(0, min(int(math.floor(fy)), grid_size - 1))
-        ty2 = min(ty1 + 1, grid_size - 1)
-        wy = fy - ty1
-        wy = max(0.0, min(1.0, wy))
 
-        for x in range(width):
-            fx = (x - tile_w / 2.0) / tile_w
-            tx1 = max(0, min(int(math.floor(fx)), grid_size - 1))
-            tx2 = min(tx1 + 1, grid_size - 1)
-            wx = fx - tx1
-            wx = max(0.0, min(1.0, wx))
+def _dither_buffer(src):
+    """Return the reused int16 dither buffer loaded with src.
+
+    The image sits at buf[:height, 2:width + 2] with zeroed padding of 2
+    rows below and 2 columns either side, so every diffusion target of the
+    dither kernels is in bounds and their loops need no edge checks. Only
+    the padding is re-zeroed; the interior is overwritten by src.
+    """
+    height, width = src.shape
+    buf = _get_scratch("dither", (height + 2, width + 4), np.int16)
+    buf[:height, 2 : width + 2] = src
+    buf[:height, :2] = 0
+    buf[:height, width + 2 :] = 0
+    buf[height:] = 0
+    return buf
+
+
+def _cv2_clahe(clip_limit, grid_size):
+    """Return a cached OpenCV CLAHE object for the given parameters."""
+    key = (float(clip_limit), grid_size)
+    handle = _CLAHE.get(key)
+    if handle is None:
+        handle = cv2.createCLAHE(
+            clipLimit=key[0], tileGridSize=(grid_size, grid_size)
+        )
+        _CLAHE[key] = handle
+    return handle
 
-            val = src[y][x]
-            v00 = luts[(tx1, ty1)][val]
-            v10 = luts[(tx2, ty1)][val]
-            v01 = luts[(tx1, ty2)][val]
-            v11 = luts[(tx2, ty2)][val]
 
-            top = v00 * (1 - wx) + v10 * wx
-            bot = v01 * (1 - wx) + v11 * wx
-            result = top * (1 - wy) + bot * wy
-            out_pixels[x, y] = min(255, max(0, int(result)))
+def _tile_weights(size, tile, grid_size):
+    """Return the neighboring tile indices and blend weight per pixel.
 
-    return out
+    For each coordinate along one axis, yields the index of the tile
+    center at or before it, the next tile index, and the weight of the
+    latter, all clamped to the grid edges.
+    """
+    f = (np.arange(size) - tile / 2.0) / tile
+    t1 = np.clip(np.floor(f).astype(np.intp), 0, grid_size - 1)
+    t2 = np.minimum(t1 + 1, grid_size - 1)
+    w = np.clip(f - t1, 0.0, 1.0)
+    return t1, t2, w
 
 
 def preprocess(img, contrast=1.5, sharpen=1.5, gamma=1.0):
@@ -140,78 +292,135 @@ def preprocess(img, contrast=1.5, sharpen=1.5, gamma=1.0):
 
     # Gamma correction: <1.0 brightens midtones, >1.0 darkens them.
     if gamma != 1.0:
-        lut = [min(255, int(255.0 * (i / 255.0) ** gamma)) for i in range(256)]
-        img = img.point(lut)
+        lut = np.clip(255.0 * (np.arange(256) / 255.0) ** gamma, 0, 255)
+        img = img.point(lut.astype(np.uint8).tolist())
 
     return img
 
 
-def atkinson_dither(pixels, width, height):
+def atkinson_dither(buf, width, height, clamp):
     """Atkinson dithering: diffuses only 6/8 of error for crisper detail.
 
     Bill Atkinson's algorithm (used in the original Mac) preserves more
     contrast than Floyd-Steinberg by intentionally losing 1/4 of the error.
     This creates a more "contrasty" look that's great for portraits.
+
+    buf is a dither buffer from _dither_buffer, dithered in place. Error is
+    propagated in integer fixed point, (err + 4) >> 3 being err / 8 rounded
+    to nearest. With clamp set, accumulated values are kept within
+    ERROR_MIN..ERROR_MAX so error cannot pile up near edges.
     """
+    lo, hi = ERROR_MIN, ERROR_MAX
     for y in range(height):
-        for x in range(width):
-            old = pixels[y][x]
-            new = 255.0 if old > 127.5 else 0.0
-            pixels[y][x] = new
-            err = (old - new) / 8.0
+        for x in range(2, width + 2):
+            old = int(buf[y, x])
+            new = 255 if old >= 128 else 0
+            buf[y, x] = new
+            err = (old - new + 4) >> 3
 
             # Atkinson distributes error to 6 neighbors (each gets err/8):
             #        X  1  1
             #     1  1  1
             #        1
-            neighbors = [
-                (x + 1, y),
-                (x + 2, y),
-                (x - 1, y + 1),
-                (x, y + 1),
-                (x + 1, y + 1),
-                (x, y + 2),
-            ]
-            for nx, ny in neighbors:
-                if 0 <= nx < width and 0 <= ny < height:
-                    pixels[ny][nx] += err
-
-
-def floyd_steinberg_dither(pixels, width, height):
-    """Classic Floyd-Steinberg error diffusion."""
+            if clamp:
+                v = buf[y, x + 1] + err
+                buf[y, x + 1] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y, x + 2] + err
+                buf[y, x + 2] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y + 1, x - 1] + err
+                buf[y + 1, x - 1] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y + 1, x] + err
+                buf[y + 1, x] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y + 1, x + 1] + err
+                buf[y + 1, x + 1] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y + 2, x] + err
+                buf[y + 2, x] = lo if v < lo else (hi if v > hi else v)
+            else:
+                buf[y, x + 1] += err
+                buf[y, x + 2] += err
+                buf[y + 1, x - 1] += err
+                buf[y + 1, x] += err
+                buf[y + 1, x + 1] += err
+                buf[y + 2, x] += err
+
+
+def floyd_steinberg_dither(buf, width, height, serpentine, clamp):
+    """Classic Floyd-Steinberg error diffusion.
+
+    buf is a dither buffer from _dither_buffer, dithered in place, with the
+    7/16, 3/16 and 5/16 shares computed as (err * k + 8) >> 4 and the 1/16
+    share taking the remainder so that all four sum to err exactly. With
+    serpentine set, odd rows are scanned right-to-left (and the diffusion
+    kernel mirrored) to break up the directional "worm" artifacts of a
+    strict left-to-right scan. clamp bounds accumulated error as in
+    atkinson_dither.
+    """
+    lo, hi = ERROR_MIN, ERROR_MAX
     for y in range(height):
-        for x in range(width):
-            old = pixels[y][x]
-            new = 255.0 if old > 127.5 else 0.0
-            pixels[y][x] = new
+        if serpentine and y % 2 == 1:
+            start, stop, step = width + 1, 1, -1
+        else:
+            start, stop, step = 2, width + 2, 1
+        for x in range(start, stop, step):
+            old = int(buf[y, x])
+            new = 255 if old >= 128 else 0
+            buf[y, x] = new
             err = old - new
-            if x + 1 < width:
-                pixels[y][x + 1] += err * 7.0 / 16.0
-            if y + 1 < height:
-                if x - 1 >= 0:
-                    pixels[y + 1][x - 1] += err * 3.0 / 16.0
-                pixels[y + 1][x] += err * 5.0 / 16.0
-                if x + 1 < width:
-                    pixels[y + 1][x + 1] += err * 1.0 / 16.0
 
+            # x + step is the next pixel in scan order, x - step the previous.
+            e7 = (err * 7 + 8) >> 4
+            e3 = (err * 3 + 8) >> 4
+            e5 = (err * 5 + 8) >> 4
+            e1 = err - e7 - e3 - e5
+            if clamp:
+                ahead = x + step
+                behind = x - step
+                v = buf[y, ahead] + e7
+                buf[y, ahead] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y + 1, behind] + e3
+                buf[y + 1, behind] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y + 1, x] + e5
+                buf[y + 1, x] = lo if v < lo else (hi if v > hi else v)
+                v = buf[y + 1, ahead] + e1
+                buf[y + 1, ahead] = lo if v < lo else (hi if v > hi else v)
+            else:
+                buf[y, x + step] += e7
+                buf[y + 1, x - step] += e3
+                buf[y + 1, x] += e5
+                buf[y + 1, x + step] += e1
+
+
+def braille_pack(bits):
+    """Pack a (height, width) boolean dot array into Braille codepoints.
+
+    height must be a multiple of 4 and width a multiple of 2. Returns a
+    (height // 4, width // 2) array of codepoints in the U+2800 block.
+    """
+    if _braille_pack_ext is not None:
+        return _braille_pack_ext(np.ascontiguousarray(bits, dtype=np.uint8))
 
-def image_to_braille(
-    image_path,
-    char_width=25,
-    invert=False,
-    dither="atkinson",
-    contrast=1.5,
-    sharpen=1.5,
-    gamma=1.0,
+    height, width = bits.shape
+    cells = bits.reshape(height // 4, 4, width // 2, 2).transpose(0, 2, 1, 3)
+    packed = np.packbits(cells.reshape(-1, 8), axis=1, bitorder="big")
+    return BRAILLE_LUT[packed.ravel()].reshape(height // 4, width // 2)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_and_preprocess(
+    image_path, mtime_ns, size, px_width, contrast, sharpen, gamma
 ):
-    """Convert image to Braille art string."""
+    """Load, resize and enhance an image, returning a read-only uint8 array.
+
+    Memoized so that repeated renders of the same image (e.g. at several
+    dither settings) skip decoding, resizing and CLAHE. mtime_ns and size
+    only key the cache, so an image changed on disk is reloaded.
+    """
     img = Image.open(image_path).convert("L")
 
     # Auto-crop to face region: trim uniform borders.
     img = ImageOps.autocontrast(img, cutoff=0.5)
 
     # Pixel dimensions: each Braille char covers 2 pixel cols x 4 pixel rows.
-    px_width = char_width * 2
     px_height = int(img.height * px_width / img.width)
     # Round up to multiple of 4 for clean row mapping.
     px_height = ((px_height + 3) // 4) * 4
@@ -221,37 +430,66 @@ def image_to_braille(
     # Preprocessing: enhance for Braille rendering.
     img = preprocess(img, contrast=contrast, sharpen=sharpen, gamma=gamma)
 
-    # Build float pixel grid for dithering.
-    pixels = []
-    for y in range(px_height):
-        row = []
-        for x in range(px_width):
-            row.append(float(img.getpixel((x, y))))
-        pixels.append(row)
+    arr = np.array(img, dtype=np.uint8)
+    arr.flags.writeable = False
+    return arr
 
-    if dither == "atkinson":
-        atkinson_dither(pixels, px_width, px_height)
+
+def image_to_braille(
+    image_path,
+    char_width=25,
+    invert=False,
+    dither="atkinson",
+    contrast=1.5,
+    sharpen=1.5,
+    gamma=1.0,
+    serpentine=False,
+    clamp_errors=True,
+):
+    """Convert image to Braille art string.
+
+    serpentine applies to Floyd-Steinberg only; Atkinson always scans
+    left-to-right and ignores it. clamp_errors keeps accumulated values
+    within 0..255; Pillow's Floyd-Steinberg already does, so it serves the
+    clamped, non-serpentine case and the custom kernel the rest.
+    """
+    st = os.stat(image_path)
+    src = _load_and_preprocess(
+        image_path,
+        st.st_mtime_ns,
+        st.st_size,
+        char_width * 2,
+        contrast,
+        sharpen,
+        gamma,
+    )
+    px_height, px_width = src.shape
+
+    if dither == "floyd-steinberg" and clamp_errors and not serpentine:
+        # Pillow's built-in (C) Floyd-Steinberg, which clamps each
+        # accumulated value to 0..255 itself; mode "1" reads back as a
+        # boolean array that is True for white dots.
+        bw = Image.fromarray(src).convert(
+            "1", dither=Image.Dither.FLOYDSTEINBERG
+        )
+        bits = ~np.asarray(bw)
     else:
-        floyd_steinberg_dither(pixels, px_width, px_height)
+        buf = _dither_buffer(src)
+        if dither == "atkinson":
+            _kernel(atkinson_dither, buf.size)(
+                buf, px_width, px_height, clamp_errors
+            )
+        else:
+            _kernel(floyd_steinberg_dither, buf.size)(
+                buf, px_width, px_height, serpentine, clamp_errors
+            )
+        bits = buf[:px_height, 2 : px_width + 2] < 128
 
     # Map 2x4 blocks to Braille characters.
-    lines = []
-    for block_y in range(0, px_height, 4):
-        line = []
-        for block_x in range(0, px_width, 2):
-            codepoint = 0
-            for row in range(4):
-                for col in range(2):
-                    py = block_y + row
-                    px = block_x + col
-                    if py < px_height and px < px_width:
-                        is_dark = pixels[py][px] < 127.5
-                        if invert:
-                            is_dark = not is_dark
-                        if is_dark:
-                            codepoint |= BRAILLE_MAP[row][col]
-            line.append(chr(0x2800 + codepoint))
-        lines.append("".join(line))
+    if invert:
+        bits = ~bits
+    codes = braille_pack(bits)
+    lines = ["".join(map(chr, row)) for row in codes.tolist()]
 
     # Strip trailing empty Braille lines (all U+2800).
     while lines and all(c == "\u2800" for c in lines[-1]):
@@ -300,7 +538,20 @@ def main():
         default=1.0,
         help="Gamma correction: <1 brightens, >1 darkens (default: 1.0)",
     )
+    parser.add_argument(
+        "--serpentine",
+        action="store_true",
+        help="Alternate scan direction per row (floyd-steinberg only)",
+    )
+    parser.add_argument(
+        "--clamp-errors",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Clamp diffused values to [0, 255] (default: on)",
+    )
     args = parser.parse_args()
+    if args.serpentine and args.dither != "floyd-steinberg":
+        parser.error("--serpentine requires --dither floyd-steinberg")
 
     try:
         result = image_to_braille(
@@ -311,6 +562,8 @@ def main():
             contrast=args.contrast,
             sharpen=args.sharpen,
             gamma=args.gamma,
+            serpentine=args.serpentine,
+            clamp_errors=args.clamp_errors,
         )
     except FileNotFoundError:
         print(f"Error: file not found: {args.image}", file=sys.stderr)